@@ -2,33 +2,71 @@ import argparse
 import os
 from dotenv import load_dotenv
 import sys
-import json
 import logging
 import asyncio
-import requests
+from collections import Counter
+from itertools import islice
+import httpx
+import orjson
+import redis
+import redis.asyncio
 from typing import Optional, Dict, Any, List
 
 from mcp.server.fastmcp import FastMCP
 
-load_dotenv()
-
-logging.basicConfig(
-    level=logging.INFO,
-    format="%(asctime)s - %(name)s - %(levelname)s - %(message)s",
-)
 logger = logging.getLogger("mcp-weather-sse")
 
 DEFAULT_HOST = "127.0.0.1"
 DEFAULT_PORT = 8080
+DEFAULT_MAX_CONCURRENCY = 5
 OPENWEATHER_API_BASE_URL = "https://api.openweathermap.org/data/2.5"
+WEATHER_CACHE_TTL = 600
+FORECAST_CACHE_TTL = 1800
+REDIS_TIMEOUT = 0.5
+UNIT_SUFFIXES = {
+    "metric": ("°C", "m/s"),
+    "imperial": ("°F", "mph"),
+}
+CURRENT_SUMMARIES = {
+    "rain": "Don't forget your umbrella!",
+    "drizzle": "Don't forget your umbrella!",
+    "thunderstorm": "Don't forget your umbrella!",
+    "snow": "Bundle up and watch for snow conditions!",
+}
+FORECAST_SUMMARIES = {
+    "rain": "Pack an umbrella and waterproof clothing.",
+    "drizzle": "Pack an umbrella and waterproof clothing.",
+    "snow": "Prepare for snowy conditions and dress warmly.",
+}
+WIND_DIRECTIONS = (
+    "N", "NNE", "NE", "ENE", "E", "ESE", "SE", "SSE",
+    "S", "SSW", "SW", "WSW", "W", "WNW", "NW", "NNW"
+)
+WIND_STEP_INV = len(WIND_DIRECTIONS) / 360.0
 
 class WeatherSSEServer:
     """MCP Server that connects to OpenWeatherMap API through SSE."""
 
-    def __init__(self, api_key: str, port: int = DEFAULT_PORT, host: str = DEFAULT_HOST):
+    def __init__(self, api_key: str, port: int = DEFAULT_PORT, host: str = DEFAULT_HOST,
+                 redis_url: Optional[str] = None, max_concurrency: int = DEFAULT_MAX_CONCURRENCY):
         self.api_key = api_key
         self.port = port
         self.host = host
+        self._http = httpx.AsyncClient(
+            base_url=OPENWEATHER_API_BASE_URL,
+            params={"appid": api_key},
+            timeout=10.0,
+            http2=True,
+            limits=httpx.Limits(max_keepalive_connections=4, max_connections=10, keepalive_expiry=60),
+        )
+        self._upstream_slots = asyncio.Semaphore(max_concurrency)
+        self._inflight: Dict[str, asyncio.Future] = {}
+        # Short socket timeouts turn a stalled Redis into a RedisError cache miss instead of a hung tool call
+        self._cache = redis.asyncio.Redis.from_url(
+            redis_url,
+            socket_connect_timeout=REDIS_TIMEOUT,
+            socket_timeout=REDIS_TIMEOUT,
+        ) if redis_url else None
         self.server = FastMCP("Weather SSE Server", version="1.0.0")
         self._register_tools()
 
@@ -43,17 +81,15 @@ class WeatherSSEServer:
         })
         async def handle_current_weather(city: str) -> Dict[str, Any]:
             try:
-                url = f"{OPENWEATHER_API_BASE_URL}/weather"
-                response = requests.get(
-                    url,
+                weather_data = await self._fetch_json(
+                    "/weather",
                     params={
                         "q": city,
-                        "units": "metric",
-                        "appid": self.api_key
-                    }
+                        "units": "metric"
+                    },
+                    cache_key=f"owm:weather:{city.lower()}:metric",
+                    ttl=WEATHER_CACHE_TTL
                 )
-                response.raise_for_status()
-                weather_data = response.json()
 
                 result = self._format_current_weather(weather_data, "metric")
 
@@ -65,7 +101,7 @@ class WeatherSSEServer:
                         }
                     ]
                 }
-            except requests.exceptions.RequestException as e:
+            except (httpx.HTTPError, orjson.JSONDecodeError) as e:
                 logger.error(f"Error fetching weather data: {str(e)}")
                 return {
                     "content": [
@@ -86,17 +122,15 @@ class WeatherSSEServer:
         })
         async def handle_weather_forecast(city: str) -> Dict[str, Any]:
             try:
-                url = f"{OPENWEATHER_API_BASE_URL}/forecast"
-                response = requests.get(
-                    url,
+                forecast_data = await self._fetch_json(
+                    "/forecast",
                     params={
                         "q": city,
-                        "units": "metric",
-                        "appid": self.api_key
-                    }
+                        "units": "metric"
+                    },
+                    cache_key=f"owm:forecast:{city.lower()}:metric",
+                    ttl=FORECAST_CACHE_TTL
                 )
-                response.raise_for_status()
-                forecast_data = response.json()
 
                 result = self._format_forecast(forecast_data, 3, "metric")
 
@@ -104,11 +138,11 @@ class WeatherSSEServer:
                     "content": [
                         {
                             "type": "text",
-                            "text": json.dumps(result, indent=2)
+                            "text": orjson.dumps(result, option=orjson.OPT_INDENT_2).decode()
                         }
                     ]
                 }
-            except requests.exceptions.RequestException as e:
+            except (httpx.HTTPError, orjson.JSONDecodeError) as e:
                 logger.error(f"Error fetching forecast data: {str(e)}")
                 return {
                     "content": [
@@ -129,18 +163,16 @@ class WeatherSSEServer:
         })
         async def handle_weather_by_coordinates(latitude: float, longitude: float) -> Dict[str, Any]:
             try: 
-                url = f"{OPENWEATHER_API_BASE_URL}/weather"
-                response = requests.get(
-                    url,
+                weather_data = await self._fetch_json(
+                    "/weather",
                     params={
                         "lat": latitude,
                         "lon": longitude,
-                        "units": "metric",
-                        "appid": self.api_key
-                    }
+                        "units": "metric"
+                    },
+                    cache_key=f"owm:weather:{latitude:.2f},{longitude:.2f}:metric",
+                    ttl=WEATHER_CACHE_TTL
                 )
-                response.raise_for_status()
-                weather_data = response.json()
 
                 result = self._format_current_weather(weather_data, "metric")
 
@@ -152,7 +184,7 @@ class WeatherSSEServer:
                         }
                     ]
                 }
-            except requests.exceptions.RequestException as e:
+            except (httpx.HTTPError, orjson.JSONDecodeError) as e:
                 logger.error(f"Error fetching weather data by coordinates: {str(e)}")
                 return {
                     "content": [
@@ -163,44 +195,141 @@ class WeatherSSEServer:
                     ]
                 }
 
+        @self.server.tool(name="get_weather_report", description="Get current weather and forecast for a city", annotations={
+            "name": "get_weather_report",
+            "title": "Get Weather Report",
+            "readOnlyHint": True,
+            "destructiveHint": False,
+            "idempotentHint": False,
+            "openWorldHint": True
+        })
+        async def handle_weather_report(city: str) -> Dict[str, Any]:
+            try:
+                params = {
+                    "q": city,
+                    "units": "metric"
+                }
+                # Fetch both endpoints concurrently so latency is the slower of the two, not the sum
+                weather_data, forecast_data = await asyncio.gather(
+                    self._fetch_json(
+                        "/weather",
+                        params=params,
+                        cache_key=f"owm:weather:{city.lower()}:metric",
+                        ttl=WEATHER_CACHE_TTL
+                    ),
+                    self._fetch_json(
+                        "/forecast",
+                        params=params,
+                        cache_key=f"owm:forecast:{city.lower()}:metric",
+                        ttl=FORECAST_CACHE_TTL
+                    )
+                )
+
+                result = (self._format_current_weather(weather_data, "metric")
+                          + "\n\n" + self._format_forecast(forecast_data, 3, "metric"))
+
+                return {
+                    "content": [
+                        {
+                            "type": "text",
+                            "text": result
+                        }
+                    ]
+                }
+            except (httpx.HTTPError, orjson.JSONDecodeError) as e:
+                logger.error(f"Error fetching weather report: {str(e)}")
+                return {
+                    "content": [
+                        {
+                            "type": "text",
+                            "text": f"Error fetching weather report: {str(e)}"
+                        }
+                    ]
+                }
+
+    async def _fetch_json(self, path: str, params: Dict[str, Any], cache_key: str, ttl: int) -> Dict[str, Any]:
+        """Fetch an OpenWeatherMap endpoint, serving from the Redis cache when possible."""
+        if self._cache is not None:
+            try:
+                cached = await self._cache.get(cache_key)
+                if cached is not None:
+                    return orjson.loads(cached)
+            except (redis.RedisError, ValueError) as e:
+                # Unreachable Redis or a corrupt entry is treated as a miss
+                logger.warning(f"Cache lookup failed for {cache_key}: {str(e)}")
+
+        # Coalesce concurrent misses on the same key into a single upstream call
+        fetch = self._inflight.get(cache_key)
+        if fetch is None:
+            fetch = asyncio.ensure_future(self._fetch_and_store(path, params, cache_key, ttl))
+            self._inflight[cache_key] = fetch
+            fetch.add_done_callback(self._make_inflight_done(cache_key))
+        return await asyncio.shield(fetch)
+
+    def _make_inflight_done(self, cache_key: str):
+        def _inflight_done(fetch: asyncio.Future) -> None:
+            self._inflight.pop(cache_key, None)
+            # Mark the exception as retrieved; every awaiting caller may already have been cancelled
+            if not fetch.cancelled():
+                fetch.exception()
+        return _inflight_done
+
+    async def _fetch_and_store(self, path: str, params: Dict[str, Any], cache_key: str, ttl: int) -> Dict[str, Any]:
+        # Bound concurrent upstream calls so bursts queue here rather than all hitting the API at once
+        async with self._upstream_slots:
+            async with self._http.stream("GET", path, params=params) as response:
+                response.raise_for_status()
+                data = orjson.loads(await response.aread())
+
+        if self._cache is not None:
+            try:
+                await self._cache.setex(cache_key, ttl, orjson.dumps(data))
+            except redis.RedisError as e:
+                logger.warning(f"Cache store failed for {cache_key}: {str(e)}")
+
+        return data
+
     def _format_current_weather(self, data: Dict[str, Any], units: str) -> str:
-        temp_unit = "°C" if units == "metric" else "°F"
-        speed_unit = "m/s" if units == "metric" else "mph"
+        temp_unit, speed_unit = UNIT_SUFFIXES.get(units, UNIT_SUFFIXES["metric"])
 
         try:
+            main = data.get('main') or {}
+            wind = data.get('wind') or {}
+            weather = (data.get('weather') or [{}])[0]
+
             location_name = data.get("name", "Unknown")
-            country = data.get("sys", {}).get("country", "Unknown")
-            temp = data.get('main', {}).get('temp', 0)
-            feels_like = data.get('main', {}).get('feels_like', 0)
-            humidity = data.get('main', {}).get('humidity', 0)
-            pressure = data.get('main', {}).get('pressure', 0)
-            wind_speed = data.get('wind', {}).get('speed', 0)
-            wind_deg = data.get('wind', {}).get('deg', 0)
+            country = (data.get("sys") or {}).get("country", "Unknown")
+            temp = main.get('temp', 0)
+            feels_like = main.get('feels_like', 0)
+            humidity = main.get('humidity', 0)
+            pressure = main.get('pressure', 0)
+            wind_speed = wind.get('speed', 0)
+            wind_deg = wind.get('deg', 0)
             wind_direction = self._get_wind_direction(wind_deg)
-            weather_main = data.get('weather', [{}])[0].get('main', "Unknown")
-            weather_desc = data.get('weather', [{}])[0].get('description', "Unknown").capitalize()
+            weather_main = weather.get('main', "Unknown")
+            weather_desc = weather.get('description', "Unknown").capitalize()
             visibility = data.get('visibility', 0) / 1000
-            cloudiness = data.get('clouds', {}).get('all', 0)
+            cloudiness = (data.get('clouds') or {}).get('all', 0)
 
             # Build the main weather description
-            weather_str = f"🌍 Weather Report for {location_name}, {country}\n\n"
+            parts = [f"🌍 Weather Report for {location_name}, {country}\n\n"]
             
             # Current conditions paragraph
-            weather_str += f"Right now, it's {temp}{temp_unit} with {weather_desc.lower()}. "
-            weather_str += f"The temperature feels like {feels_like}{temp_unit} due to the current conditions. "
+            parts.append(f"Right now, it's {temp}{temp_unit} with {weather_desc.lower()}. ")
+            parts.append(f"The temperature feels like {feels_like}{temp_unit} due to the current conditions. ")
             
             # Wind conditions
             if wind_speed > 0:
-                weather_str += f"Winds are blowing from the {wind_direction} at {wind_speed} {speed_unit}. "
+                parts.append(f"Winds are blowing from the {wind_direction} at {wind_speed} {speed_unit}. ")
             else:
-                weather_str += "The air is calm with minimal wind. "
+                parts.append("The air is calm with minimal wind. ")
 
             # Atmospheric conditions
-            weather_str += f"\n\nThe atmosphere shows {humidity}% humidity"
+            parts.append(f"\n\nThe atmosphere shows {humidity}% humidity")
             if cloudiness > 0:
-                weather_str += f" with {cloudiness}% cloud cover"
-            weather_str += f". Visibility extends to {visibility:.1f} kilometers"
-            weather_str += f", and the barometric pressure reads {pressure} hPa."
+                parts.append(f" with {cloudiness}% cloud cover")
+            parts.append(f". Visibility extends to {visibility:.1f} kilometers")
+            parts.append(f", and the barometric pressure reads {pressure} hPa.")
 
             # Precipitation information if present
             precipitation_info = []
@@ -215,30 +344,29 @@ class WeatherSSEServer:
                     precipitation_info.append(f"❄️ {snow_1h}mm of snow has accumulated in the last hour")
 
             if precipitation_info:
-                weather_str += "\n\n" + ". ".join(precipitation_info) + "."
+                parts.append("\n\n" + ". ".join(precipitation_info) + ".")
 
             # Add a summary recommendation based on conditions
-            weather_str += "\n\n📝 Summary: "
-            if weather_main.lower() in ["rain", "drizzle", "thunderstorm"]:
-                weather_str += "Don't forget your umbrella!"
-            elif weather_main.lower() == "snow":
-                weather_str += "Bundle up and watch for snow conditions!"
-            elif weather_main.lower() == "clear" and temp > 20:
-                weather_str += "Great weather for outdoor activities!"
-            elif weather_main.lower() == "clear" and temp < 10:
-                weather_str += "Clear but chilly - dress warmly!"
-            else:
-                weather_str += f"Typical {weather_main.lower()} conditions for this area."
+            parts.append("\n\n📝 Summary: ")
+            condition = weather_main.lower()
+            summary = CURRENT_SUMMARIES.get(condition)
+            if summary is None:
+                if condition == "clear" and temp > 20:
+                    summary = "Great weather for outdoor activities!"
+                elif condition == "clear" and temp < 10:
+                    summary = "Clear but chilly - dress warmly!"
+                else:
+                    summary = f"Typical {condition} conditions for this area."
+            parts.append(summary)
 
-            return weather_str
+            return "".join(parts)
 
         except (KeyError, IndexError) as e:
             logger.error(f"Error formatting current weather data: {str(e)}")
             return f"Error formatting weather data: {str(e)}"
 
     def _format_forecast(self, data: Dict[str, Any], days: int, units: str) -> str:
-        temp_unit = "°C" if units == "metric" else "°F"
-        speed_unit = "m/s" if units == "metric" else "mph"
+        temp_unit, speed_unit = UNIT_SUFFIXES.get(units, UNIT_SUFFIXES["metric"])
 
         try:
             city_data = data.get("city", {})
@@ -248,105 +376,121 @@ class WeatherSSEServer:
 
             # Group forecasts by date
             daily_forecasts = {}
+            add_forecast = daily_forecasts.setdefault
             for item in forecast_list:
-                date = item.get("dt_txt", "").split(" ")[0]
-                time = item.get("dt_txt", "").split(" ")[1]
-                
-                if date not in daily_forecasts:
-                    daily_forecasts[date] = []
-                
-                daily_forecasts[date].append({
+                # dt_txt is "YYYY-MM-DD HH:MM:SS"; slice around the space rather than splitting twice
+                dt_txt = item.get("dt_txt", "")
+                sep = dt_txt.find(" ")
+                date = dt_txt[:sep] if sep > 0 else ""
+                time = dt_txt[sep + 1:] if sep > 0 else ""
+
+                main = item.get('main') or {}
+                wind = item.get('wind') or {}
+                weather = (item.get('weather') or [{}])[0]
+                rain = item.get('rain')
+                snow = item.get('snow')
+
+                add_forecast(date, []).append({
                     "time": time,
-                    "temp": item.get('main', {}).get('temp', 0),
-                    "feels_like": item.get('main', {}).get('feels_like', 0),
-                    "min_temp": item.get('main', {}).get('temp_min', 0),
-                    "max_temp": item.get('main', {}).get('temp_max', 0),
-                    "humidity": item.get('main', {}).get('humidity', 0),
-                    "weather_main": item.get('weather', [{}])[0].get('main', "Unknown"),
-                    "weather_desc": item.get('weather', [{}])[0].get('description', "Unknown").capitalize(),
-                    "wind_speed": item.get('wind', {}).get('speed', 0),
-                    "wind_deg": item.get('wind', {}).get('deg', 0),
-                    "cloudiness": item.get('clouds', {}).get('all', 0),
-                    "rain": item.get('rain', {}).get('3h', 0) if 'rain' in item else 0,
-                    "snow": item.get('snow', {}).get('3h', 0) if 'snow' in item else 0
+                    "temp": main.get('temp', 0),
+                    "feels_like": main.get('feels_like', 0),
+                    "min_temp": main.get('temp_min', 0),
+                    "max_temp": main.get('temp_max', 0),
+                    "humidity": main.get('humidity', 0),
+                    "weather_main": weather.get('main', "Unknown"),
+                    "weather_desc": weather.get('description', "Unknown").capitalize(),
+                    "wind_speed": wind.get('speed', 0),
+                    "wind_deg": wind.get('deg', 0),
+                    "cloudiness": (item.get('clouds') or {}).get('all', 0),
+                    "rain": rain.get('3h', 0) if rain else 0,
+                    "snow": snow.get('3h', 0) if snow else 0
                 })
 
-            # Get the dates we want to show
-            forecast_dates = list(daily_forecasts.keys())[:days]
-            
             # Start building the forecast string
-            forecast_str = f"🗓️ {days}-Day Weather Forecast for {city_name}, {country}\n\n"
+            parts = [f"🗓️ {days}-Day Weather Forecast for {city_name}, {country}\n\n"]
+
+            # Walk only the first `days` dates straight off the dict view
+            for date, forecasts in islice(daily_forecasts.items(), days):
+                # Calculate daily statistics and condition counts in a single pass
+                max_temp = min_temp = forecasts[0]["temp"]
+                total_humidity = total_rain = total_snow = 0
+                condition_counts = Counter()
+                for f in forecasts:
+                    temp = f["temp"]
+                    if temp > max_temp:
+                        max_temp = temp
+                    elif temp < min_temp:
+                        min_temp = temp
+                    total_humidity += f["humidity"]
+                    total_rain += f["rain"]
+                    total_snow += f["snow"]
+                    condition = f["weather_main"].lower()
+                    condition_counts[condition] += 1
+                avg_humidity = total_humidity / len(forecasts)
 
-            for date in forecast_dates:
-                forecasts = daily_forecasts[date]
-                
-                # Calculate daily statistics
-                max_temp = max(f["temp"] for f in forecasts)
-                min_temp = min(f["temp"] for f in forecasts)
-                avg_humidity = sum(f["humidity"] for f in forecasts) / len(forecasts)
-                total_rain = sum(f["rain"] for f in forecasts)
-                total_snow = sum(f["snow"] for f in forecasts)
-                
                 # Get the most common weather condition
-                weather_conditions = [f["weather_main"].lower() for f in forecasts]
-                main_condition = max(set(weather_conditions), key=weather_conditions.count)
+                main_condition = condition_counts.most_common(1)[0][0]
                 
                 # Format the date to be more readable
                 formatted_date = date.split("-")
                 formatted_date = f"{formatted_date[2]}/{formatted_date[1]}"  # DD/MM format
                 
                 # Build the daily forecast paragraph
-                forecast_str += f"📅 {formatted_date}:\n"
-                forecast_str += f"Expect {main_condition} conditions throughout the day. "
-                forecast_str += f"Temperatures will range from {min_temp}{temp_unit} to {max_temp}{temp_unit}, "
-                forecast_str += f"with humidity around {avg_humidity:.0f}%. "
+                parts.append(f"📅 {formatted_date}:\n")
+                parts.append(f"Expect {main_condition} conditions throughout the day. ")
+                parts.append(f"Temperatures will range from {min_temp}{temp_unit} to {max_temp}{temp_unit}, ")
+                parts.append(f"with humidity around {avg_humidity:.0f}%. ")
                 
                 # Add precipitation information if present
                 if total_rain > 0:
-                    forecast_str += f"🌧️ Expected rainfall: {total_rain:.1f}mm. "
+                    parts.append(f"🌧️ Expected rainfall: {total_rain:.1f}mm. ")
                 if total_snow > 0:
-                    forecast_str += f"❄️ Expected snowfall: {total_snow:.1f}mm. "
+                    parts.append(f"❄️ Expected snowfall: {total_snow:.1f}mm. ")
                 
                 # Add detailed timeline
-                forecast_str += "\n\nHourly Timeline:\n"
-                for forecast in forecasts:
-                    time = forecast["time"].split(":")[0]  # Get just the hour
-                    forecast_str += (f"  • {time}:00 - {forecast['temp']}{temp_unit}, "
-                                   f"{forecast['weather_desc'].lower()}, "
-                                   f"wind {forecast['wind_speed']} {speed_unit}\n")
+                parts.append("\n\nHourly Timeline:\n")
+                parts.extend(
+                    f"  • {forecast['time'].split(':')[0]}:00 - {forecast['temp']}{temp_unit}, "
+                    f"{forecast['weather_desc'].lower()}, "
+                    f"wind {forecast['wind_speed']} {speed_unit}\n"
+                    for forecast in forecasts
+                )
                 
                 # Add recommendations based on conditions
-                forecast_str += "\n💡 Day Summary: "
-                if "rain" in main_condition or "drizzle" in main_condition:
-                    forecast_str += "Pack an umbrella and waterproof clothing."
-                elif "snow" in main_condition:
-                    forecast_str += "Prepare for snowy conditions and dress warmly."
-                elif "clear" in main_condition and max_temp > 20:
-                    forecast_str += "Perfect weather for outdoor activities!"
-                elif "clear" in main_condition and min_temp < 10:
-                    forecast_str += "Clear but chilly - layer your clothing."
-                else:
-                    forecast_str += f"Typical {main_condition} conditions expected."
+                parts.append("\n💡 Day Summary: ")
+                summary = FORECAST_SUMMARIES.get(main_condition)
+                if summary is None:
+                    if main_condition == "clear" and max_temp > 20:
+                        summary = "Perfect weather for outdoor activities!"
+                    elif main_condition == "clear" and min_temp < 10:
+                        summary = "Clear but chilly - layer your clothing."
+                    else:
+                        summary = f"Typical {main_condition} conditions expected."
+                parts.append(summary)
                 
-                forecast_str += "\n\n" + "-"*50 + "\n\n"
+                parts.append("\n\n" + "-"*50 + "\n\n")
             
-            return forecast_str
+            return "".join(parts)
 
         except (KeyError, IndexError) as e:
             logger.error(f"Error formatting weather forecast data: {str(e)}")
             return f"Error formatting forecast data: {str(e)}"
 
     def _get_wind_direction(self, degrees: float) -> str:
-        directions = [
-            "N", "NNE", "NE", "ENE", "E", "ESE", "SE", "SSE",
-            "S", "SSW", "SW", "WSW", "W", "WNW", "NW", "NNW"
-        ]
-        index = round(degrees / (360 / len(directions))) % len(directions)
-        return directions[index]
+        # 16 compass points, so the modulo reduces to a bitmask
+        return WIND_DIRECTIONS[round(degrees * WIND_STEP_INV) & 15]
 
     async def start(self):
         logger.info(f"Starting MCP Weather SSE Server on {self.host}:{self.port}")
-        await self.server.run_sse_async()
+        try:
+            await self.server.run_sse_async()
+        finally:
+            await self.aclose()
+
+    async def aclose(self):
+        await self._http.aclose()
+        if self._cache is not None:
+            await self._cache.aclose()
 
 def parse_args():
     parser = argparse.ArgumentParser(description="MCP Weather SSE Server")
@@ -372,14 +516,38 @@ def parse_args():
 
 async def main():
     args = parse_args()
+    load_dotenv()
+    logging.basicConfig(
+        level=logging.INFO,
+        format="%(asctime)s - %(name)s - %(levelname)s - %(message)s",
+    )
+    # httpx logs full request URLs at INFO, and those include the appid query parameter
+    logging.getLogger("httpx").setLevel(logging.WARNING)
+    logging.getLogger("httpcore").setLevel(logging.WARNING)
     api_key = os.environ.get("OPENWEATHER_API_KEY")
 
     if not api_key:
         logger.error("API key is required. Please provide it using --api-key or set the OPENWEATHER_API_KEY environment variable.")
         sys.exit(1)
 
-    server = WeatherSSEServer(api_key=api_key, port=args.port, host=args.host)
+    redis_url = os.environ.get("REDIS_URL")
+    try:
+        max_concurrency = int(os.environ.get("OWM_CONCURRENCY", DEFAULT_MAX_CONCURRENCY))
+    except ValueError:
+        max_concurrency = 0
+    if max_concurrency < 1:
+        logger.error("OWM_CONCURRENCY must be a positive integer.")
+        sys.exit(1)
+
+    server = WeatherSSEServer(api_key=api_key, port=args.port, host=args.host,
+                              redis_url=redis_url, max_concurrency=max_concurrency)
     await server.start()
 
 if __name__ == "__main__":
+    # The loop policy must be installed before asyncio.run creates the loop
+    try:
+        import uvloop
+        asyncio.set_event_loop_policy(uvloop.EventLoopPolicy())
+    except ImportError:
+        pass
     asyncio.run(main())
\ No newline at end of file